@@ -3,7 +3,8 @@
 """
 Collect & Print Sheets for SVG Cards (Magic-size)
 - Reads individual SVG card files (63x88 mm design; e.g., 744x1039 px)
-- Rasterizes them with Inkscape (CLI), then packs them 3x3 per A4 page at 300 dpi
+- Rasterizes them in-process (resvg or CairoSVG; Inkscape CLI as fallback),
+  then packs them 3x3 per A4 page at 300 dpi
 - Adds optional crop marks
 - Writes a multi-page PDF
 
@@ -13,12 +14,25 @@ python collect_and_print.py --cards ./cards \
   --add "Potion_of_Brightmind=5" \
   --out sheets/cards_print.pdf --dpi 300 --crop
 
-Requires: Inkscape in PATH (for SVG rasterization). Pillow for PDF assembly.
+Requires: resvg-py or cairosvg (or Inkscape in PATH) for SVG rasterization. Pillow and NumPy for PDF assembly.
 """
-import argparse, os, math, shutil, subprocess, tempfile
+import argparse, hashlib, io, os, math, re, shutil, subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
-from PIL import Image, ImageDraw
+from typing import Iterator, List, Optional, Tuple
+import numpy as np
+from PIL import Image, UnidentifiedImageError
+
+try:
+    import resvg_py
+except ImportError:
+    resvg_py = None
+
+try:
+    import cairosvg
+except (ImportError, OSError):  # OSError: cairosvg installed but libcairo missing
+    cairosvg = None
 
 def find_inkscape() -> str:
     exe = shutil.which("inkscape")
@@ -35,20 +49,150 @@ def find_inkscape() -> str:
             return str(c)
     return ""
 
-def rasterize_svg(inkscape_exe: str, svg_path: Path, out_png: Path, width_px: int, height_px: int, dpi: int) -> None:
-    out_png.parent.mkdir(parents=True, exist_ok=True)
+def _inkscape_png(inkscape_exe: str, svg_bytes: bytes, width_px: int, height_px: int, dpi: int, base_dir: Optional[Path] = None) -> bytes:
+    # SVG in on stdin, PNG out on stdout: no temp files.
+    # With --pipe Inkscape resolves relative hrefs against its cwd, so run it from the card's folder.
     cmd = [
         inkscape_exe,
+        "--pipe",
         "--export-type=png",
-        f"--export-filename={str(out_png)}",
+        "--export-filename=-",
         f"--export-width={width_px}",
         f"--export-height={height_px}",
         "--export-dpi", str(dpi),
-        str(svg_path)
+        "--export-background=#FFFFFF",
+        "--export-background-opacity=1.0",
     ]
-    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    if result.returncode != 0:
-        raise RuntimeError(f"Inkscape export failed for {svg_path.name}:\n{result.stderr}")
+    result = subprocess.run(cmd, input=svg_bytes, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=str(base_dir) if base_dir else None)
+    if result.returncode != 0 or not result.stdout:
+        raise RuntimeError(f"Inkscape export failed:\n{result.stderr.decode(errors='replace')}")
+    return result.stdout
+
+def _cairosvg_local_fetch(url, resource_type):
+    # cairosvg's default (safe_fetch) only allows data: URLs; also allow local files so linked art resolves
+    if url and (url.startswith("data:") or url.startswith("file:")):
+        return cairosvg.url.fetch(url, resource_type)
+    return b'<svg width="1" height="1"></svg>'
+
+def _cairosvg_image(svg_bytes: bytes, width_px: int, height_px: int, base_dir: Optional[Path] = None) -> Image.Image:
+    # Render onto a cairo ImageSurface and wrap its pixels directly instead of encoding/decoding a PNG.
+    # cairosvg resolves relative hrefs against the folder part of url
+    url = str(Path(base_dir).resolve() / "card.svg") if base_dir else None
+    tree = cairosvg.parser.Tree(bytestring=svg_bytes, url=url, url_fetcher=_cairosvg_local_fetch)
+    surface = cairosvg.surface.PNGSurface(tree, None, 96, output_width=width_px, output_height=height_px, background_color="#FFFFFF")
+    surface.cairo.flush()
+    size = (surface.cairo.get_width(), surface.cairo.get_height())
+    # cairo ARGB32 is native-endian (BGRA bytes on little-endian hosts); opaque, so drop alpha while unpacking
+    return Image.frombuffer("RGB", size, bytes(surface.cairo.get_data()), "raw", "BGRX", surface.cairo.get_stride(), 1)
+
+def rasterize_svg(svg_bytes: bytes, width_px: int, height_px: int, dpi: int = 300, base_dir: Optional[Path] = None) -> Image.Image:
+    """Render SVG bytes onto white to an RGB PIL image, preferring in-process renderers over Inkscape.
+
+    base_dir is where relative hrefs (linked art) are resolved, normally the card file's folder.
+    """
+    if resvg_py is not None:
+        opts = {} if base_dir is None else {"resources_dir": str(base_dir)}
+        png_bytes = resvg_py.svg_to_bytes(svg_string=svg_bytes.decode("utf-8"), width=width_px, height=height_px, background="#FFFFFF", **opts)
+    elif cairosvg is not None:
+        return _cairosvg_image(svg_bytes, width_px, height_px, base_dir)
+    else:
+        inkscape = find_inkscape()
+        if not inkscape:
+            raise EnvironmentError("No SVG renderer found. Install resvg-py or cairosvg, or Inkscape in PATH.")
+        png_bytes = _inkscape_png(inkscape, svg_bytes, width_px, height_px, dpi, base_dir)
+    img = Image.open(io.BytesIO(png_bytes))
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    return img
+
+def default_cache_dir() -> Path:
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "svg-cardmaker"
+
+def _renderer_name() -> str:
+    if resvg_py is not None:
+        return "resvg"
+    if cairosvg is not None:
+        return "cairosvg"
+    return "inkscape"
+
+_HREF_RE = re.compile(rb'\bhref\s*=\s*"([^"]+)"')
+
+def _linked_files(svg_bytes: bytes, base_dir: Optional[Path]) -> List[Path]:
+    """Existing local files the SVG links to; data: URIs, #fragments and remote URLs are skipped."""
+    out = []
+    for m in _HREF_RE.finditer(svg_bytes):
+        href = m.group(1).decode("utf-8", "replace").split("#", 1)[0]
+        if not href or (re.match(r"[A-Za-z][A-Za-z0-9+.-]*:", href) and not re.match(r"[A-Za-z]:[\\/]", href)):
+            continue  # empty, fragment-only or has a URL scheme (data:, http:, ...); Windows drive paths are kept
+        p = Path(href)
+        if not p.is_absolute() and base_dir is not None:
+            p = Path(base_dir) / p
+        if p.is_file():
+            out.append(p)
+    return sorted(set(out))
+
+def _raster_one(args) -> Image.Image:
+    # src is an SVG file path or already-built SVG bytes (whole-sheet mode, which passes base_dir explicitly)
+    src, width_px, height_px, dpi, cache_dir, base_dir = args
+    if isinstance(src, bytes):
+        svg_bytes = src
+    else:
+        svg_bytes = Path(src).read_bytes()
+        base_dir = base_dir or Path(src).parent
+    cached = None
+    if cache_dir:
+        h = hashlib.blake2b(svg_bytes, digest_size=16)
+        h.update(f"|{width_px}x{height_px}@{dpi}|{_renderer_name()}".encode("ascii"))
+        # linked art is not part of the SVG bytes; key on its mtime so editing it invalidates the raster
+        for linked in _linked_files(svg_bytes, base_dir):
+            st = linked.stat()
+            h.update(f"|{linked}:{st.st_mtime_ns}:{st.st_size}".encode("utf-8"))
+        cached = Path(cache_dir) / f"{h.hexdigest()}.png"
+        try:
+            img = Image.open(cached)
+            img.load()
+            return img if img.mode == "RGB" else img.convert("RGB")
+        except (OSError, UnidentifiedImageError):
+            pass  # missing, unreadable or corrupt entry: treat as a miss
+    img = rasterize_svg(svg_bytes, width_px, height_px, dpi, base_dir)
+    img.load()
+    if cached is not None:
+        # the cache is best-effort; never let it abort a print run
+        tmp = cached.with_name(f"{cached.stem}.{os.getpid()}.tmp")
+        try:
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            img.save(tmp, "PNG")
+            os.replace(tmp, cached)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+    return img
+
+def iter_rasterized(tasks, jobs: int = 0) -> Iterator[Image.Image]:
+    """Yield rendered tasks in order; tasks may be a lazy iterable.
+
+    At most `workers` tasks are in flight, so a lazy producer is only pulled as results are consumed.
+    """
+    workers = jobs or os.cpu_count() or 1
+    if hasattr(tasks, "__len__"):
+        workers = min(workers, len(tasks))
+    if workers <= 1:
+        for t in tasks:
+            yield _raster_one(t)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        pending = deque()
+        for t in tasks:
+            pending.append(ex.submit(_raster_one, t))
+            if len(pending) >= workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def rasterize_all(tasks, jobs: int = 0) -> List[Image.Image]:
+    return list(iter_rasterized(tasks, jobs))
 
 def a4_dimensions(dpi: int, orientation: str):
     if orientation == "a4portrait":
@@ -57,74 +201,172 @@ def a4_dimensions(dpi: int, orientation: str):
         w_in, h_in = 11.692913386, 8.267716535
     return int(round(w_in * dpi)), int(round(h_in * dpi))
 
-def layout_positions(sheet_w: int, sheet_h: int, card_w: int, card_h: int, cols: int, rows: int, margin_px: int, gutter_px: int):
-    positions = []
+def layout_positions(sheet_w: int, sheet_h: int, card_w: int, card_h: int, cols: int, rows: int, margin_px: int, gutter_px: int) -> np.ndarray:
+    """Top-left corner of every card slot, row-major, as an (N, 2) int32 array of (x, y)."""
     total_cards_w = cols*card_w + (cols-1)*gutter_px
     total_cards_h = rows*card_h + (rows-1)*gutter_px
     x0 = (sheet_w - total_cards_w)//2
     y0 = (sheet_h - total_cards_h)//2
-    for r in range(rows):
-        for c in range(cols):
-            x = x0 + c*(card_w + gutter_px)
-            y = y0 + r*(card_h + gutter_px)
-            positions.append((x,y))
-    return positions
-
-def draw_crop_marks(draw: ImageDraw.ImageDraw, x: int, y: int, w: int, h: int, bleed:int=0, len_px: int=24, offset:int=6, color=(0,0,0)):
-    draw.line([(x - offset - len_px, y - offset), (x - offset, y - offset)], fill=color, width=1)
-    draw.line([(x - offset, y - offset - len_px), (x - offset, y - offset)], fill=color, width=1)
-    draw.line([(x + w + offset, y - offset), (x + w + offset + len_px, y - offset)], fill=color, width=1)
-    draw.line([(x + w + offset, y - offset - len_px), (x + w + offset, y - offset)], fill=color, width=1)
-    draw.line([(x - offset - len_px, y + h + offset), (x - offset, y + h + offset)], fill=color, width=1)
-    draw.line([(x - offset, y + h + offset), (x - offset, y + h + offset + len_px)], fill=color, width=1)
-    draw.line([(x + w + offset, y + h + offset), (x + w + offset + len_px, y + h + offset)], fill=color, width=1)
-    draw.line([(x + w + offset, y + h + offset), (x + w + offset, y + h + offset + len_px)], fill=color, width=1)
+    return np.array([(x0 + c*(card_w + gutter_px), y0 + r*(card_h + gutter_px)) for r in range(rows) for c in range(cols)], dtype=np.int32).reshape(-1, 2)
+
+def _hline(arr, y: int, x0: int, x1: int, color):
+    # inclusive on both ends like ImageDraw.line; clipped so negative indices cannot wrap around
+    h, w = arr.shape[:2]
+    start, stop = max(x0, 0), min(x1 + 1, w)
+    if 0 <= y < h and start < stop:
+        arr[y, start:stop] = color
+
+def _vline(arr, x: int, y0: int, y1: int, color):
+    h, w = arr.shape[:2]
+    start, stop = max(y0, 0), min(y1 + 1, h)
+    if 0 <= x < w and start < stop:
+        arr[start:stop, x] = color
+
+def draw_crop_marks(arr: np.ndarray, x: int, y: int, w: int, h: int, bleed:int=0, len_px: int=24, offset:int=6, color=(0,0,0)):
+    _hline(arr, y - offset, x - offset - len_px, x - offset, color)
+    _vline(arr, x - offset, y - offset - len_px, y - offset, color)
+    _hline(arr, y - offset, x + w + offset, x + w + offset + len_px, color)
+    _vline(arr, x + w + offset, y - offset - len_px, y - offset, color)
+    _hline(arr, y + h + offset, x - offset - len_px, x - offset, color)
+    _vline(arr, x - offset, y + h + offset, y + h + offset + len_px, color)
+    _hline(arr, y + h + offset, x + w + offset, x + w + offset + len_px, color)
+    _vline(arr, x + w + offset, y + h + offset, y + h + offset + len_px, color)
+
+_SVG_ROOT_RE = re.compile(r"<svg\b([^>]*)>(.*)</svg>", re.S)
+_VIEWBOX_RE = re.compile(r'viewBox="([^"]*)"')
+_ID_RE = re.compile(r'\bid="([^"]+)"')
+_XMLNS_RE = re.compile(r'\bxmlns:([A-Za-z_][\w.-]*)\s*=\s*"([^"]*)"')
+
+def _card_symbol(svg_text: str, sym_id: str) -> Tuple[str, dict]:
+    """Return the card body as a <symbol>, plus the xmlns:* prefixes its root declared."""
+    m = _SVG_ROOT_RE.search(svg_text)
+    if not m:
+        raise ValueError(f"Not an SVG document (for {sym_id})")
+    attrs, body = m.groups()
+    vb = _VIEWBOX_RE.search(attrs)
+    view_box = f' viewBox="{vb.group(1)}"' if vb else ""
+    namespaces = dict(_XMLNS_RE.findall(attrs))
+    # prefix ids so every card's "artClip" etc. stays distinct once the cards share one document
+    for old in set(_ID_RE.findall(body)):
+        new = f"{sym_id}_{old}"
+        body = body.replace(f'id="{old}"', f'id="{new}"').replace(f"#{old})", f"#{new})").replace(f'"#{old}"', f'"#{new}"')
+    return f'<symbol id="{sym_id}"{view_box}>{body}</symbol>', namespaces
+
+def build_sheet_svg(card_svgs: List[str], positions, sheet_w: int, sheet_h: int, card_w: int, card_h: int) -> str:
+    """Lay out one page as a single SVG: each distinct card becomes a <symbol>, each slot a <use>."""
+    ids = {}
+    defs = []
+    uses = []
+    # prefixed attributes (xlink:href, inkscape:*, ...) inside the symbols need their declarations on the sheet root
+    namespaces = {"xlink": "http://www.w3.org/1999/xlink"}
+    for svg_text, (x,y) in zip(card_svgs, positions):
+        if svg_text not in ids:
+            ids[svg_text] = f"card_{len(ids)}"
+            symbol, card_ns = _card_symbol(svg_text, ids[svg_text])
+            defs.append(symbol)
+            for prefix, uri in card_ns.items():
+                namespaces.setdefault(prefix, uri)
+        uses.append(f'<use href="#{ids[svg_text]}" x="{x}" y="{y}" width="{card_w}" height="{card_h}"/>')
+    xmlns = "".join(f' xmlns:{prefix}="{uri}"' for prefix, uri in namespaces.items())
+    return (
+        f'<svg width="{sheet_w}px" height="{sheet_h}px" viewBox="0 0 {sheet_w} {sheet_h}" xmlns="http://www.w3.org/2000/svg"{xmlns}>'
+        f'<defs>{"".join(defs)}</defs>'
+        f'<rect x="0" y="0" width="{sheet_w}" height="{sheet_h}" fill="#FFFFFF"/>'
+        f'{"".join(uses)}</svg>'
+    )
+
+def blank_sheet(sheet_w: int, sheet_h: int, marked_positions, card_w: int, card_h: int) -> np.ndarray:
+    arr = np.full((sheet_h, sheet_w, 3), 255, np.uint8)
+    for (x,y) in marked_positions:
+        draw_crop_marks(arr, x, y, card_w, card_h, len_px=28, offset=8)
+    return arr
+
+def _pil_to_np(img: Image.Image) -> np.ndarray:
+    # read-only (h, w, bands) view over a single tobytes() copy; fine as a blit source
+    img.load()
+    return np.frombuffer(img.tobytes(), np.uint8).reshape(img.height, img.width, len(img.getbands()))
+
+def blit(arr: np.ndarray, card: np.ndarray, x: int, y: int):
+    # copy card into arr at (x, y), clipped to the sheet like Image.paste
+    h, w = arr.shape[:2]
+    ch, cw = card.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + cw, w), min(y + ch, h)
+    if x0 < x1 and y0 < y1:
+        arr[y0:y1, x0:x1] = card[y0 - y:y1 - y, x0 - x:x1 - x]
 
 def collect_files(cards_dir: Path, requests):
     index = {}
-    for p in cards_dir.glob("*.svg"):
-        index[p.stem.lower()] = p
+    with os.scandir(cards_dir) as it:
+        for e in it:
+            # normcase keeps Path.glob's per-platform rule: ".SVG" matches on Windows, not on POSIX
+            if os.path.normcase(e.name).endswith(".svg"):
+                index[e.name[:-4].casefold()] = Path(e.path)
     out = []
     for base, count in requests:
-        key = base.lower()
+        key = base.casefold()
         if key not in index:
             raise FileNotFoundError(f"Card SVG '{base}.svg' not found in {cards_dir}")
         out.extend([index[key]]*count)
     return out
 
-def make_sheets(svg_paths, out_pdf: Path, dpi: int = 300, orientation: str = "a4portrait", cols:int=3, rows:int=3, margin_px:int=60, gutter_px:int=18, card_w:int=744, card_h:int=1039, add_crop: bool=False):
-    inkscape = find_inkscape()
-    if not inkscape:
-        raise EnvironmentError("Inkscape not found. Please install Inkscape and ensure it's in PATH.")
+def _pages_by_card(chunks, unique, positions, sheet_w, sheet_h, card_w, card_h, dpi, add_crop, jobs, cache_dir) -> Iterator[Image.Image]:
+    imgs = rasterize_all([(svg, card_w, card_h, dpi, cache_dir, None) for svg in unique], jobs)
+    cache = {svg: _pil_to_np(img) for svg, img in zip(unique, imgs)}
+    template = blank_sheet(sheet_w, sheet_h, positions if add_crop else [], card_w, card_h)
+    for chunk in chunks:
+        if add_crop and len(chunk) < len(positions):
+            # partial last page: only mark the slots that hold a card
+            arr = blank_sheet(sheet_w, sheet_h, positions[:len(chunk)], card_w, card_h)
+        else:
+            arr = template.copy()
+        for svg, (x,y) in zip(chunk, positions):
+            blit(arr, cache[svg], x, y)
+        yield Image.fromarray(arr, "RGB")
+
+def _sheet_tasks(chunks, positions, sheet_w, sheet_h, card_w, card_h, dpi) -> Iterator[tuple]:
+    # built lazily: each sheet inlines its cards' base64 art, so only the pages in flight exist at once
+    for chunk in chunks:
+        texts = {svg: svg.read_text(encoding="utf-8") for svg in dict.fromkeys(chunk)}
+        sheet = build_sheet_svg([texts[svg] for svg in chunk], positions, sheet_w, sheet_h, card_w, card_h)
+        # collect_files takes every card from one directory; linked art in the inlined cards resolves against it
+        yield (sheet.encode("utf-8"), sheet_w, sheet_h, dpi, None, chunk[0].parent)
+
+def _pages_by_sheet(chunks, positions, sheet_w, sheet_h, card_w, card_h, dpi, add_crop, jobs) -> Iterator[Image.Image]:
+    # one renderer call per page; sheets are one-off combinations, so they bypass the card cache
+    tasks = _sheet_tasks(chunks, positions, sheet_w, sheet_h, card_w, card_h, dpi)
+    for chunk, img in zip(chunks, iter_rasterized(tasks, min(jobs or os.cpu_count() or 1, len(chunks)))):
+        arr = np.array(img)
+        if add_crop:
+            # marks sit in the gutters, so drawing them after the cards covers nothing
+            for (x,y) in positions[:len(chunk)]:
+                draw_crop_marks(arr, x, y, card_w, card_h, len_px=28, offset=8)
+        yield Image.fromarray(arr, "RGB")
+
+def make_sheets(svg_paths, out_pdf: Path, dpi: int = 300, orientation: str = "a4portrait", cols:int=3, rows:int=3, margin_px:int=60, gutter_px:int=18, card_w:int=744, card_h:int=1039, add_crop: bool=False, jobs: int=0, cache_dir: Optional[Path]=None, whole_sheet: bool=False, quality: Optional[int]=None):
     sheet_w, sheet_h = a4_dimensions(dpi, orientation)
-    positions = layout_positions(sheet_w, sheet_h, card_w, card_h, cols, rows, margin_px, gutter_px)
+    # plain (x, y) int tuples for the per-card loops below
+    positions = [tuple(p) for p in layout_positions(sheet_w, sheet_h, card_w, card_h, cols, rows, margin_px, gutter_px).tolist()]
     per_page = cols*rows
-    pages = []
-    import tempfile
-    tmpdir = Path(tempfile.mkdtemp(prefix="cards_ras_"))
-    try:
-        pngs = []
-        for i, svg in enumerate(svg_paths, 1):
-            png = tmpdir / f"card_{i:04d}.png"
-            rasterize_svg(inkscape, svg, png, card_w, card_h, dpi)
-            pngs.append(png)
-        for i in range(0, len(pngs), per_page):
-            page = Image.new("RGB", (sheet_w, sheet_h), (255,255,255))
-            draw = ImageDraw.Draw(page)
-            chunk = pngs[i:i+per_page]
-            for png, (x,y) in zip(chunk, positions):
-                img = Image.open(png).convert("RGB")
-                page.paste(img, (x,y))
-                if add_crop:
-                    draw_crop_marks(draw, x, y, card_w, card_h, len_px=28, offset=8)
-            pages.append(page)
-        out_pdf.parent.mkdir(parents=True, exist_ok=True)
-        if len(pages) == 1:
-            pages[0].save(out_pdf, "PDF", resolution=dpi)
-        else:
-            pages[0].save(out_pdf, "PDF", resolution=dpi, save_all=True, append_images=pages[1:])
-    finally:
-        pass
+    chunks = [svg_paths[i:i+per_page] for i in range(0, len(svg_paths), per_page)]
+    unique = list(dict.fromkeys(svg_paths))
+    if whole_sheet:
+        pages = _pages_by_sheet(chunks, positions, sheet_w, sheet_h, card_w, card_h, dpi, add_crop, jobs)
+    else:
+        pages = _pages_by_card(chunks, unique, positions, sheet_w, sheet_h, card_w, card_h, dpi, add_crop, jobs, cache_dir)
+    out_pdf.parent.mkdir(parents=True, exist_ok=True)
+    # Pillow embeds RGB pages as JPEG (DCTDecode); quality=None keeps Pillow's default
+    save_opts = {} if quality is None else {"quality": quality}
+    # write each page as soon as it is composed; card mode then holds one sheet (plus the unique-card cache),
+    # sheet mode at most one rendered page per worker
+    for n, page in enumerate(pages):
+        page.save(out_pdf, "PDF", resolution=dpi, append=n > 0, **save_opts)
+
+def jpeg_quality(value: str) -> int:
+    q = int(value)
+    if not 1 <= q <= 95:
+        raise argparse.ArgumentTypeError(f"must be between 1 and 95, got {q}")
+    return q
 
 def parse_adds(add_list):
     out = []
@@ -150,6 +392,11 @@ def main():
     ap.add_argument("--margin", type=int, default=60, help="Outer margin in px (at sheet DPI)")
     ap.add_argument("--gutter", type=int, default=18, help="Gap between cards in px (at sheet DPI)")
     ap.add_argument("--crop", action="store_true", help="Add crop marks around each card")
+    ap.add_argument("--jobs", type=int, default=0, help="Parallel rasterization workers (default: CPU count)")
+    ap.add_argument("--cache-dir", type=str, default=str(default_cache_dir()), help="Directory for cached card PNGs, keyed on SVG content and the mtimes of linked local images")
+    ap.add_argument("--no-cache", action="store_true", help="Always re-rasterize, ignoring the PNG cache")
+    ap.add_argument("--quality", type=jpeg_quality, default=None, help="JPEG quality (1-95) for the embedded page images (default: Pillow's 75)")
+    ap.add_argument("--sheet-svg", action="store_true", help="Rasterize each page as one SVG of <use>d card symbols (one renderer call per page; best with Inkscape)")
 
     args = ap.parse_args()
 
@@ -159,7 +406,7 @@ def main():
         ap.error("Please add at least one --add 'Name=count'")
 
     svg_list = collect_files(cards_dir, requests)
-    make_sheets(svg_list, Path(args.out), dpi=args.dpi, orientation=args.orientation, cols=args.cols, rows=args.rows, margin_px=args.margin, gutter_px=args.gutter, add_crop=args.crop)
+    make_sheets(svg_list, Path(args.out), dpi=args.dpi, orientation=args.orientation, cols=args.cols, rows=args.rows, margin_px=args.margin, gutter_px=args.gutter, add_crop=args.crop, jobs=args.jobs, cache_dir=None if args.no_cache else Path(args.cache_dir), whole_sheet=args.sheet_svg, quality=args.quality)
     print(f"Created: {args.out}")
 
 if __name__ == "__main__":
@@ -4,9 +4,12 @@ import argparse
 import json
 import re
 import base64
+from functools import lru_cache, partial
 from glob import glob
+from multiprocessing import Pool
 from pathlib import Path
 from string import Template
+from textwrap import wrap as _tw_wrap
 
 SVG_TEMPLATE = r"""<?xml version="1.0" encoding="UTF-8" standalone="no"?>
 <svg width="${card_w}px" height="${card_h}px" viewBox="0 0 ${card_w} ${card_h}" xmlns="http://www.w3.org/2000/svg">
@@ -37,28 +40,64 @@ SVG_TEMPLATE = r"""<?xml version="1.0" encoding="UTF-8" standalone="no"?>
 </svg>
 """
 
+def _compile_template(template):
+    # split a string.Template once into literal chunks and the placeholder names between them
+    chunks, names, pos, lit = [], [], 0, ""
+    for m in Template.pattern.finditer(template):
+        lit += template[pos:m.start()]
+        pos = m.end()
+        if m.group("escaped") is not None:
+            lit += "$"
+            continue
+        name = m.group("named") or m.group("braced")
+        if name is None:
+            raise ValueError(f"Invalid placeholder in template at offset {m.start()}")
+        chunks.append(lit)
+        names.append(name)
+        lit = ""
+    chunks.append(lit + template[pos:])
+    return tuple(chunks), tuple(names)
+
+_SVG_CHUNKS, _SVG_FIELDS = _compile_template(SVG_TEMPLATE)
+
+def render_svg_template(**fields) -> str:
+    out = [_SVG_CHUNKS[0]]
+    for name, lit in zip(_SVG_FIELDS, _SVG_CHUNKS[1:]):
+        out.append(str(fields[name]))
+        out.append(lit)
+    return "".join(out)
+
+@lru_cache(maxsize=None)
+def _data_uri(path_str, mime, mtime_ns):
+    # mtime_ns is only part of the cache key, so edited art is re-encoded
+    data = Path(path_str).read_bytes()
+    b64 = base64.b64encode(data).decode("ascii")
+    return f"data:{mime};base64,{b64}"
+
 def data_uri_for_image(path, mime="image/png"):
     p = Path(path)
     if not p.exists():
         return None
-    data = p.read_bytes()
-    b64 = base64.b64encode(data).decode("ascii")
-    return f"data:{mime};base64,{b64}"
+    return _data_uri(str(p), mime, p.stat().st_mtime_ns)
+
+@lru_cache(maxsize=2048)
+def _wrap_cached(text, width):
+    return tuple(_tw_wrap(text, width=width, break_long_words=False))
 
 def wrap_svg_text(text, width_chars=62, line_height=20, x=None):  
     if isinstance(text, list):
-        tmp = ""
-        for el in text:
-            tmp += el + "\n"
-        text = tmp
+        text = "".join(el + "\n" for el in text)
+    return _wrap_svg_tspans(text, width_chars, line_height, x)
 
+@lru_cache(maxsize=2048)
+def _wrap_svg_tspans(text, width_chars, line_height, x):
     text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
     lines = []
     for para in text.split("\n"):
         if para.strip() == "":
             lines.append({"text": "", "newline": True})
             continue
-        for line in __import__("textwrap").wrap(para, width=width_chars, break_long_words=False):
+        for line in _wrap_cached(para, width_chars):
             lines.append({"text": line, "newline": True})
     tspans = []
     y = 0
@@ -74,25 +113,25 @@ def wrap_svg_text(text, width_chars=62, line_height=20, x=None):
 def build_frame_str(theme) -> str:
     (card_w, card_h) = theme["card_sz"]
     (x,y,w,h) = theme["inner_rec"]
-    frame_str =  f'<rect x="0" y="0" width="{card_w}" height="{card_h}" fill="{theme["frame_bg"]}" rx="18" ry="18"/>' 
-    frame_str += f'<rect x="{x}" y="{y}" width="{w}" height="{h}" fill="{theme["frame_inner"]}" rx="14" ry="14" stroke="{theme["frame_border"]}" stroke-width="2"/>'
-    return frame_str
+    parts = [f'<rect x="0" y="0" width="{card_w}" height="{card_h}" fill="{theme["frame_bg"]}" rx="18" ry="18"/>']
+    parts.append(f'<rect x="{x}" y="{y}" width="{w}" height="{h}" fill="{theme["frame_inner"]}" rx="14" ry="14" stroke="{theme["frame_border"]}" stroke-width="2"/>')
+    return "".join(parts)
 
 def build_title_str(theme, name, rarity) -> str:
     (x, y, w, h) = theme["title_rec"]
-    title_str = f'<rect x="{x}" y="{y}" width="{w}" height="{h}" rx="8" ry="8" fill="{theme["title_bg"]}" stroke="{theme["frame_border"]}" stroke-width="2"/>'
+    parts = [f'<rect x="{x}" y="{y}" width="{w}" height="{h}" rx="8" ry="8" fill="{theme["title_bg"]}" stroke="{theme["frame_border"]}" stroke-width="2"/>']
 
     (x, y, fs) = theme["title_txt_rec"]
-    title_str += f'<text x="{x}" y="{y}" font-family="{theme["font_serif"]}" font-size="{fs}" font-weight="700" fill="{theme["title_fg"]}">{name}</text>'
+    parts.append(f'<text x="{x}" y="{y}" font-family="{theme["font_serif"]}" font-size="{fs}" font-weight="700" fill="{theme["title_fg"]}">{name}</text>')
 
     (x, y, fs) = theme["title_rarity_rec"]
-    title_str += f'<text x="{x}" y="{y}" font-family="{theme["font_serif"]}" font-size="{fs}" text-anchor="end" fill="{theme["title_fg"]}">{rarity}</text>'
-    return title_str
+    parts.append(f'<text x="{x}" y="{y}" font-family="{theme["font_serif"]}" font-size="{fs}" text-anchor="end" fill="{theme["title_fg"]}">{rarity}</text>')
+    return "".join(parts)
 
 def build_art_str(theme, art_path) -> tuple[str, str]:
     (x, y, w, h) = theme["art_rec"]
     clipping_art = f'<clipPath id="artClip"><rect x="{x}" y="{y}" rx="10" ry="10" width="{w}" height="{h}" /></clipPath>'
-    art_img = f'<rect x="{x}" y="{y}" width="{w}" height="{h}" rx="10" ry="10" fill="{theme["art_bg"]}" stroke="{theme["frame_border"]}" stroke-width="2"/>'
+    parts = [f'<rect x="{x}" y="{y}" width="{w}" height="{h}" rx="10" ry="10" fill="{theme["art_bg"]}" stroke="{theme["frame_border"]}" stroke-width="2"/>']
     if art_path:
         mime = "image/png"
         ap = str(art_path).lower()
@@ -100,56 +139,67 @@ def build_art_str(theme, art_path) -> tuple[str, str]:
             mime = "image/jpeg"
         uri = data_uri_for_image(art_path, mime=mime)
         if uri:
-            art_img = f'<image href="{uri}" x="{x}" y="{y}" width="{w}" height="{h}" preserveAspectRatio="xMidYMid slice" clip-path="url(#artClip)" />'
-    art_img += f'<rect x="{x}" y="{y}" width="{w}" height="{h}" rx="10" ry="10" fill-opacity="0" stroke="{theme["frame_border"]}" stroke-width="2"/>'
+            parts[0] = f'<image href="{uri}" x="{x}" y="{y}" width="{w}" height="{h}" preserveAspectRatio="xMidYMid slice" clip-path="url(#artClip)" />'
+    parts.append(f'<rect x="{x}" y="{y}" width="{w}" height="{h}" rx="10" ry="10" fill-opacity="0" stroke="{theme["frame_border"]}" stroke-width="2"/>')
 
-    return (clipping_art, art_img)
+    return (clipping_art, "".join(parts))
 
 def build_type_str(theme, type) -> str:
     (x, y, w, h) = theme["type_rec"]
-    type_str =  f'<rect x="{x}" y="{y}" width="{w}" height="{h}" rx="6" ry="6" fill="{theme["type_bg"]}" stroke="{theme["frame_border"]}" stroke-width="2"/>'
+    parts = [f'<rect x="{x}" y="{y}" width="{w}" height="{h}" rx="6" ry="6" fill="{theme["type_bg"]}" stroke="{theme["frame_border"]}" stroke-width="2"/>']
 
     (x, y, fs) = theme["type_txt_rec"]
-    type_str += f'<text x="{x}" y="{y}" font-family="{theme["font_sans"]}" font-size="{fs}" font-weight="600" fill="{theme["type_fg"]}">{type}</text>'
-    return type_str
+    parts.append(f'<text x="{x}" y="{y}" font-family="{theme["font_sans"]}" font-size="{fs}" font-weight="600" fill="{theme["type_fg"]}">{type}</text>')
+    return "".join(parts)
 
 def build_rules_str(theme, rules, flavor) -> str:
     (x, y, w, h) = theme["rules_rec"]
-    rules_str =  f'<rect x="{x}" y="{y}" width="{w}" height="{h}" rx="10" ry="10" fill="{theme["rules_bg"]}" stroke="{theme["frame_border"]}" stroke-width="2"/>'
+    parts = [f'<rect x="{x}" y="{y}" width="{w}" height="{h}" rx="10" ry="10" fill="{theme["rules_bg"]}" stroke="{theme["frame_border"]}" stroke-width="2"/>']
 
     (x, y, fs) = theme["rules_txt_rec"]
 
     rules_lines = wrap_svg_text(rules, width_chars=60, x=x, line_height=fs)
-    rules_str += f'<text x="{x}" y="{y}" font-family="{theme["font_serif"]}" font-size="{fs}" fill="{theme["rules_fg"]}">{rules_lines}</text>'
+    parts.append(f'<text x="{x}" y="{y}" font-family="{theme["font_serif"]}" font-size="{fs}" fill="{theme["rules_fg"]}">{rules_lines}</text>')
 
     (x, y, fs) = theme["flavor_txt_rec"]
     flavor_lines=""
     if flavor:
       flavor_lines = wrap_svg_text("“" + flavor + "”", width_chars=60, x=x, line_height=fs)
-    rules_str += f'<text x="{x}" y="{y}" font-family="{theme["font_serif"]}" font-size="{fs}" font-style="italic" fill="{theme["flavor_fg"]}">{flavor_lines}</text>'
-    return rules_str
+    parts.append(f'<text x="{x}" y="{y}" font-family="{theme["font_serif"]}" font-size="{fs}" font-style="italic" fill="{theme["flavor_fg"]}">{flavor_lines}</text>')
+    return "".join(parts)
 
 def build_optional_str(theme, pt, price, weight) -> str:
     (x, y, w, h) = theme["opt_box"]
     (tx, ty, fs) = theme["opt_txt_rec"]
-    opt_str = ""
+    parts = []
     for el in [pt, price, weight]:
         if el:
-            opt_str += f'<g><rect x="{x - w}" y="{y}" width="{w}" height="{h}" rx="8" ry="8" fill="{theme["pt_bg"]}" stroke="{theme["frame_border"]}" stroke-width="2"/>'
-            opt_str += f'<text x="{tx}" y="{ty}" font-family="{theme["font_serif"]}" font-size="{fs}" font-weight="700" text-anchor="middle" fill="{theme["pt_fg"]}">{el}</text></g>'
+            parts.append(f'<g><rect x="{x - w}" y="{y}" width="{w}" height="{h}" rx="8" ry="8" fill="{theme["pt_bg"]}" stroke="{theme["frame_border"]}" stroke-width="2"/>')
+            parts.append(f'<text x="{tx}" y="{ty}" font-family="{theme["font_serif"]}" font-size="{fs}" font-weight="700" text-anchor="middle" fill="{theme["pt_fg"]}">{el}</text></g>')
             x  -= (w + 6)
             tx -= (w + 6)
-    return opt_str
+    return "".join(parts)
 
 def build_footer_str(theme, set_code, collector, author, copyright_str) -> str:
     (x, y, fs) = theme["footer_txt_rec_l"]
-    footer_str =  f'<g><text x="{x}" y="{y}" font-family="{theme["font_sans"]}" font-size="{fs}" fill="{theme["footer_fg"]}">{set_code} • {collector} • {author}</text>'
+    parts = [f'<g><text x="{x}" y="{y}" font-family="{theme["font_sans"]}" font-size="{fs}" fill="{theme["footer_fg"]}">{set_code} • {collector} • {author}</text>']
 
     (x, y, fs) = theme["footer_txt_rec_r"]
-    footer_str += f'<text x="{x}" y="{y}" font-family="{theme["font_sans"]}" font-size="{fs}" text-anchor="end" fill="{theme["footer_fg"]}">{copyright_str}</text></g>'
-    return footer_str
+    parts.append(f'<text x="{x}" y="{y}" font-family="{theme["font_sans"]}" font-size="{fs}" text-anchor="end" fill="{theme["footer_fg"]}">{copyright_str}</text></g>')
+    return "".join(parts)
 
-def get_theme( name, rarity) -> dict:
+RARITY_COLORS = {
+    "Common":     "#B0B0B0",
+    "Uncommon":   "#81AD82",
+    "Rare":       "#B8D8F1",
+    "Very Rare":  "#F1DAB6",
+    "Legendary":  "#CF9F9F",
+    "Quest":      "#E9E3B5",
+}
+
+@lru_cache(maxsize=None)
+def _base_theme() -> tuple:
+    # geometry and colors shared by every card; returned as frozen items so the cached value can't be mutated
     card_width = 744
     card_height = 1039
     outer_padding = 12
@@ -204,18 +254,13 @@ def get_theme( name, rarity) -> dict:
         "opt_txt_rec":(inner_padding + inner_width - 75, opt_y + opt_h - 16, 24),
     }
 
-    theme.update(name)
+    return tuple(theme.items())
 
-    rarity_colors = {
-    "Common":     "#B0B0B0",
-    "Uncommon":   "#81AD82",
-    "Rare":       "#B8D8F1",
-    "Very Rare":  "#F1DAB6",
-    "Legendary":  "#CF9F9F",
-    "Quest":      "#E9E3B5",
-    }
-    if rarity in rarity_colors:
-        theme["frame_inner"] = rarity_colors[rarity]
+def get_theme( name, rarity) -> dict:
+    theme = dict(_base_theme())
+    theme.update(name)
+    if rarity in RARITY_COLORS:
+        theme["frame_inner"] = RARITY_COLORS[rarity]
     return theme
 
 def build_svg(card: dict, out_dir: Path) -> Path:
@@ -233,7 +278,7 @@ def build_svg(card: dict, out_dir: Path) -> Path:
     footer_str = build_footer_str(theme, card.get("set_code","DND"), card.get("collector","001/001"), card.get("author",""), card.get("copyright","© 2025"))
 
     (w,h) = theme["card_sz"]
-    svg = Template(SVG_TEMPLATE).substitute(
+    svg = render_svg_template(
         frame_str=frame_str,
         title_str=title_str,
         clipping_art=clipping_art,
@@ -248,7 +293,11 @@ def build_svg(card: dict, out_dir: Path) -> Path:
 
     safe = re.sub(r"[^a-zA-Z0-9_-]+", "_", card.get("name","card")).strip("_")
     out = out_dir / f"{safe}.svg"
-    out.write_text(svg, encoding="utf-8")
+    new_bytes = svg.encode("utf-8")
+    # leave unchanged files untouched so mtimes (and downstream caches) stay valid
+    if out.exists() and out.stat().st_size == len(new_bytes) and out.read_bytes() == new_bytes:
+        return out
+    out.write_bytes(new_bytes)
     return out
 
 def main(cards_path:Path, output_path:Path):
@@ -270,9 +319,12 @@ def main(cards_path:Path, output_path:Path):
 
     output_path.mkdir(parents=True, exist_ok=True)
 
-    made = []
-    for card in cards:
-        made.append(build_svg(card, output_path))
+    if len(cards) < 4:
+        # not worth the worker start-up cost
+        made = [build_svg(card, output_path) for card in cards]
+    else:
+        with Pool() as pool:
+            made = list(pool.imap(partial(build_svg, out_dir=output_path), cards, chunksize=8))
 
 
     print(f"Generated {len(made)} cards into: {output_path.resolve()}")
@@ -0,0 +1,28 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import collect_and_print as cp
+
+CARD = np.random.default_rng(0).integers(0, 256, (50, 40, 3), dtype=np.uint8)
+
+@pytest.mark.parametrize("x, y", [
+    (0, 0), (5, 7), (80, 50),          # inside / flush with the far edges
+    (-10, -7), (-39, 0), (0, -49),     # partly off the top/left
+    (100, 80), (110, 90),              # partly off the bottom/right
+    (-40, 0), (0, -50), (120, 0), (0, 100), (-500, 500),  # entirely off the sheet
+])
+def test_blit_matches_image_paste(x, y):
+    arr = np.full((100, 120, 3), 255, np.uint8)
+    cp.blit(arr, CARD, x, y)
+    page = Image.new("RGB", (120, 100), (255, 255, 255))
+    page.paste(Image.fromarray(CARD, "RGB"), (x, y))
+    np.testing.assert_array_equal(arr, np.asarray(page))
+
+def test_pil_to_np_roundtrip():
+    img = Image.fromarray(CARD, "RGB")
+    np.testing.assert_array_equal(cp._pil_to_np(img), CARD)
@@ -0,0 +1,34 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import collect_and_print as cp
+
+@pytest.fixture
+def cards_dir(tmp_path):
+    for name in ("Potion_of_Healing.svg", "Straße.svg", "notes.txt"):
+        (tmp_path / name).write_text("<svg/>", encoding="utf-8")
+    (tmp_path / "Upper.SVG").write_text("<svg/>", encoding="utf-8")
+    return tmp_path
+
+def test_lookup_is_case_insensitive_and_repeats_count(cards_dir):
+    out = cp.collect_files(cards_dir, [("potion_of_healing", 2), ("POTION_OF_HEALING", 1)])
+    assert out == [cards_dir / "Potion_of_Healing.svg"] * 3
+
+def test_lookup_uses_casefold(cards_dir):
+    # "ß".casefold() == "ss", which .lower() would not match
+    assert cp.collect_files(cards_dir, [("STRASSE", 1)]) == [cards_dir / "Straße.svg"]
+
+def test_missing_card_raises(cards_dir):
+    with pytest.raises(FileNotFoundError):
+        cp.collect_files(cards_dir, [("notes", 1)])
+
+def test_uppercase_suffix_follows_platform_rule(cards_dir):
+    if os.path.normcase("A.SVG") == "a.svg":  # Windows: glob("*.svg") was case-insensitive
+        assert cp.collect_files(cards_dir, [("upper", 1)]) == [cards_dir / "Upper.SVG"]
+    else:
+        with pytest.raises(FileNotFoundError):
+            cp.collect_files(cards_dir, [("upper", 1)])
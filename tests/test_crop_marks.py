@@ -0,0 +1,49 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import collect_and_print as cp
+
+def _imagedraw_marks(draw, x, y, w, h, len_px, offset, color=(0, 0, 0)):
+    # the original ImageDraw implementation of draw_crop_marks
+    draw.line([(x - offset - len_px, y - offset), (x - offset, y - offset)], fill=color, width=1)
+    draw.line([(x - offset, y - offset - len_px), (x - offset, y - offset)], fill=color, width=1)
+    draw.line([(x + w + offset, y - offset), (x + w + offset + len_px, y - offset)], fill=color, width=1)
+    draw.line([(x + w + offset, y - offset - len_px), (x + w + offset, y - offset)], fill=color, width=1)
+    draw.line([(x - offset - len_px, y + h + offset), (x - offset, y + h + offset)], fill=color, width=1)
+    draw.line([(x - offset, y + h + offset), (x - offset, y + h + offset + len_px)], fill=color, width=1)
+    draw.line([(x + w + offset, y + h + offset), (x + w + offset + len_px, y + h + offset)], fill=color, width=1)
+    draw.line([(x + w + offset, y + h + offset), (x + w + offset, y + h + offset + len_px)], fill=color, width=1)
+
+def _compare(sheet_w, sheet_h, positions, w, h, len_px=28, offset=8):
+    arr = np.full((sheet_h, sheet_w, 3), 255, np.uint8)
+    img = Image.new("RGB", (sheet_w, sheet_h), (255, 255, 255))
+    draw = ImageDraw.Draw(img)
+    for x, y in positions:
+        cp.draw_crop_marks(arr, x, y, w, h, len_px=len_px, offset=offset)
+        _imagedraw_marks(draw, x, y, w, h, len_px, offset)
+    np.testing.assert_array_equal(arr, np.asarray(img))
+
+def test_crop_marks_match_imagedraw_on_a4_layout():
+    sheet_w, sheet_h = cp.a4_dimensions(300, "a4portrait")
+    positions = [tuple(p) for p in cp.layout_positions(sheet_w, sheet_h, 744, 1039, 3, 3, 60, 18).tolist()]
+    _compare(sheet_w, sheet_h, positions, 744, 1039)
+
+@pytest.mark.parametrize("x, y", [(10, 10), (-5, 20), (20, -30), (150, 90), (170, 130), (-60, -60), (400, 400)])
+def test_crop_marks_match_imagedraw_across_sheet_edges(x, y):
+    # 200x160 sheet with a 40x30 card: marks partly or wholly off the sheet must clip, never wrap
+    _compare(200, 160, [(x, y)], 40, 30)
+
+def test_blank_sheet_marks_only_given_slots():
+    sheet_w, sheet_h = cp.a4_dimensions(300, "a4portrait")
+    positions = [tuple(p) for p in cp.layout_positions(sheet_w, sheet_h, 744, 1039, 3, 3, 60, 18).tolist()]
+    assert (cp.blank_sheet(sheet_w, sheet_h, [], 744, 1039) == 255).all()
+    _compare(sheet_w, sheet_h, positions[:4], 744, 1039)
+    expected = np.full((sheet_h, sheet_w, 3), 255, np.uint8)
+    for x, y in positions[:4]:
+        cp.draw_crop_marks(expected, x, y, 744, 1039, len_px=28, offset=8)
+    np.testing.assert_array_equal(cp.blank_sheet(sheet_w, sheet_h, positions[:4], 744, 1039), expected)
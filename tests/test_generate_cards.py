@@ -0,0 +1,65 @@
+import json
+import os
+import sys
+from pathlib import Path
+from string import Template
+
+import pytest
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+import generate_cards as gc
+
+def _card(name):
+    for db in sorted((REPO / "card-db").glob("*.json")):
+        for card in json.loads(db.read_text(encoding="utf-8"))["cards"]:
+            if card["name"] == name:
+                return card
+    raise LookupError(name)
+
+@pytest.fixture
+def in_repo(monkeypatch):
+    # art_path in the card db is relative to the repository root
+    monkeypatch.chdir(REPO)
+
+def test_render_svg_template_matches_string_template(in_repo):
+    card = _card("Potion of Supreme Healing")
+    theme = gc.get_theme(card.get("theme", {}), card["rarity"])
+    clipping_art, art_img = gc.build_art_str(theme, card["art_path"])
+    fields = dict(
+        frame_str=gc.build_frame_str(theme),
+        title_str=gc.build_title_str(theme, card["name"], card["rarity"]),
+        clipping_art=clipping_art,
+        art_img=art_img,
+        type_str=gc.build_type_str(theme, card["type_line"]),
+        rules_str=gc.build_rules_str(theme, card["rules_text"], card["flavor_text"]),
+        opt_str=gc.build_optional_str(theme, card["pt"], card["price"], card["weight"]),
+        footer_str=gc.build_footer_str(theme, card["set_code"], card["collector"], card["author"], card["copyright"]),
+        card_w=744,
+        card_h=1039,
+    )
+    assert gc.render_svg_template(**fields) == Template(gc.SVG_TEMPLATE).substitute(**fields)
+
+def test_render_svg_template_requires_every_field():
+    with pytest.raises(KeyError):
+        gc.render_svg_template(card_w=744, card_h=1039)
+
+def test_build_svg_matches_committed_output(in_repo, tmp_path):
+    # out_cards/ holds SVGs made before the builders were optimised; output must stay byte-for-byte identical
+    out = gc.build_svg(_card("Potion of Supreme Healing"), tmp_path)
+    assert out.read_bytes() == (REPO / "out_cards" / "Potion_of_Supreme_Healing.svg").read_bytes()
+
+def test_get_theme_returns_independent_dicts():
+    a = gc.get_theme({"frame_bg": "#000"}, "Rare")
+    b = gc.get_theme({}, "Common")
+    assert a["frame_bg"] == "#000" and b["frame_bg"] == "#1b1b1b"
+    assert a["frame_inner"] == gc.RARITY_COLORS["Rare"]
+    # the rarity color still wins over a card's own frame_inner
+    assert gc.get_theme({"frame_inner": "#123456"}, "Rare")["frame_inner"] == gc.RARITY_COLORS["Rare"]
+
+def test_build_svg_leaves_unchanged_file_untouched(in_repo, tmp_path):
+    card = _card("Potion of Supreme Healing")
+    out = gc.build_svg(card, tmp_path)
+    os.utime(out, ns=(1_000_000_000, 1_000_000_000))
+    assert gc.build_svg(card, tmp_path) == out
+    assert out.stat().st_mtime_ns == 1_000_000_000
@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import collect_and_print as cp
+
+LINKED_CARD = """<svg width="744px" height="1039px" viewBox="0 0 744 1039" xmlns="http://www.w3.org/2000/svg">
+  <image href="art/red.png" x="0" y="0" width="744" height="1039" preserveAspectRatio="none"/>
+</svg>
+"""
+
+def _has_renderer():
+    return cp.resvg_py is not None or cp.cairosvg is not None or bool(cp.find_inkscape())
+
+@pytest.fixture
+def cards_dir(tmp_path):
+    (tmp_path / "art").mkdir()
+    Image.new("RGB", (100, 100), (255, 0, 0)).save(tmp_path / "art" / "red.png")
+    (tmp_path / "Red.svg").write_text(LINKED_CARD, encoding="utf-8")
+    return tmp_path
+
+@pytest.mark.skipif(not _has_renderer(), reason="no SVG renderer available")
+def test_relative_image_link_resolves_against_card_dir(cards_dir, monkeypatch):
+    monkeypatch.chdir(cards_dir.parent)
+    img = cp._raster_one((cards_dir / "Red.svg", 744, 1039, 300, None, None))
+    assert tuple(np.asarray(img)[519, 372]) == (255, 0, 0)
+
+@pytest.mark.skipif(not _has_renderer(), reason="no SVG renderer available")
+def test_relative_image_link_resolves_in_sheet_mode(cards_dir, monkeypatch):
+    monkeypatch.chdir(cards_dir.parent)
+    card = cards_dir / "Red.svg"
+    sheet_w, sheet_h = cp.a4_dimensions(300, "a4portrait")
+    positions = [tuple(p) for p in cp.layout_positions(sheet_w, sheet_h, 744, 1039, 3, 3, 60, 18).tolist()]
+    page = next(cp._pages_by_sheet([[card]], positions, sheet_w, sheet_h, 744, 1039, 300, False, 1))
+    x, y = positions[0]
+    assert tuple(np.asarray(page)[y + 519, x + 372]) == (255, 0, 0)
@@ -0,0 +1,55 @@
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import collect_and_print as cp
+
+LINKED_CARD = """<svg width="744px" height="1039px" viewBox="0 0 744 1039" xmlns="http://www.w3.org/2000/svg">
+  <image href="art/art.png" x="0" y="0" width="744" height="1039" preserveAspectRatio="none"/>
+</svg>
+"""
+
+pytestmark = pytest.mark.skipif(
+    not (cp.resvg_py is not None or cp.cairosvg is not None or cp.find_inkscape()),
+    reason="no SVG renderer available",
+)
+
+@pytest.fixture
+def card(tmp_path):
+    (tmp_path / "art").mkdir()
+    Image.new("RGB", (100, 100), (255, 0, 0)).save(tmp_path / "art" / "art.png")
+    path = tmp_path / "Linked.svg"
+    path.write_text(LINKED_CARD, encoding="utf-8")
+    return path
+
+def _centre(img):
+    return tuple(np.asarray(img)[519, 372])
+
+def test_unusable_cache_dir_is_ignored(card, tmp_path):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    img = cp._raster_one((card, 744, 1039, 300, blocker / "cache", None))
+    assert _centre(img) == (255, 0, 0)
+
+def test_corrupt_cache_entry_is_a_miss(card, tmp_path):
+    cache = tmp_path / "cache"
+    cp._raster_one((card, 744, 1039, 300, cache, None))
+    for entry in cache.glob("*.png"):
+        entry.write_bytes(b"not a png")
+    img = cp._raster_one((card, 744, 1039, 300, cache, None))
+    assert _centre(img) == (255, 0, 0)
+    assert not list(cache.glob("*.tmp"))
+
+def test_editing_linked_art_invalidates_cache(card, tmp_path):
+    cache = tmp_path / "cache"
+    assert _centre(cp._raster_one((card, 744, 1039, 300, cache, None))) == (255, 0, 0)
+    art = card.parent / "art" / "art.png"
+    Image.new("RGB", (100, 100), (0, 0, 255)).save(art)
+    st = art.stat()
+    os.utime(art, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert _centre(cp._raster_one((card, 744, 1039, 300, cache, None))) == (0, 0, 255)
@@ -0,0 +1,36 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import collect_and_print as cp
+
+NAMESPACED_CARD = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<svg width="744px" height="1039px" viewBox="0 0 744 1039" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape">
+  <defs><rect id="r" x="100" y="100" width="300" height="400" fill="#c03030"/></defs>
+  <g inkscape:label="Layer 1">
+    <use xlink:href="#r"/>
+    <use xlink:href="#r" x="250" y="450"/>
+  </g>
+</svg>
+"""
+
+def _has_renderer():
+    return cp.resvg_py is not None or cp.cairosvg is not None or bool(cp.find_inkscape())
+
+def test_sheet_svg_declares_card_namespaces():
+    sheet = cp.build_sheet_svg([NAMESPACED_CARD], [(0, 0)], 744, 1039, 744, 1039)
+    root = sheet[:sheet.index(">")]
+    assert 'xmlns:xlink="http://www.w3.org/1999/xlink"' in root
+    assert 'xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"' in root
+    assert 'xlink:href="#card_0_r"' in sheet
+
+@pytest.mark.skipif(not _has_renderer(), reason="no SVG renderer available")
+def test_namespaced_card_renders_the_same_in_both_modes():
+    card = np.asarray(cp.rasterize_svg(NAMESPACED_CARD.encode("utf-8"), 744, 1039)).astype(int)
+    sheet_svg = cp.build_sheet_svg([NAMESPACED_CARD], [(0, 0)], 744, 1039, 744, 1039)
+    sheet = np.asarray(cp.rasterize_svg(sheet_svg.encode("utf-8"), 744, 1039)).astype(int)
+    assert (card != 255).any()
+    assert np.abs(card - sheet).max() <= 16
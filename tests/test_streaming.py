@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import collect_and_print as cp
+
+TINY = b'<svg width="8px" height="8px" viewBox="0 0 8 8" xmlns="http://www.w3.org/2000/svg"><rect width="8" height="8" fill="#000"/></svg>'
+
+pytestmark = pytest.mark.skipif(
+    not (cp.resvg_py is not None or cp.cairosvg is not None or cp.find_inkscape()),
+    reason="no SVG renderer available",
+)
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_iter_rasterized_pulls_tasks_lazily(jobs):
+    pulled = []
+
+    def tasks():
+        for i in range(6):
+            pulled.append(i)
+            yield (TINY, 8, 8, 96, None, None)
+
+    it = cp.iter_rasterized(tasks(), jobs)
+    next(it)
+    # only about one task per worker has been built before the first result is handed out
+    assert len(pulled) <= jobs
+    assert len(list(it)) == 5
+    assert len(pulled) == 6